@@ -0,0 +1,54 @@
+import os
+import sys
+import time
+import numpy as np
+import pandas as pd
+from data_transform import DataFrameTransform
+
+
+def make_loans(n_rows, seed=0):
+    '''This function generates a synthetic loan portfolio with the column types the transforms handle.
+
+    Parameters:
+    -----------
+    n_rows: int
+        The number of loans
+
+    Returns:
+    --------
+    dataframe
+        A Pandas DataFrame
+    '''
+    rng = np.random.default_rng(seed)
+    df = pd.DataFrame({'id': pd.Series(np.arange(n_rows), dtype=object)})
+    for i in range(12):
+        df[f'amount_{i}'] = rng.lognormal(8 + i % 3, 1, n_rows)
+        df.loc[rng.random(n_rows) < 0.05, f'amount_{i}'] = np.nan
+    df['mths_since_last_delinq'] = pd.array(np.where(rng.random(n_rows) < 0.6, None, rng.integers(0, 100, n_rows)), dtype='Int64')
+    df['grade'] = pd.Categorical(rng.choice(list('ABCDEFG'), n_rows))
+    df.loc[rng.random(n_rows) < 0.05, 'grade'] = np.nan
+    df['issue_date'] = pd.to_datetime(rng.choice(pd.date_range('2010-01-01', periods=120, freq='MS'), n_rows))
+    return df
+
+
+def time_method(data_frame, method, n_jobs):
+    '''This function times one DataFrameTransform method and returns (seconds, result).'''
+    transform = DataFrameTransform(data_frame, n_jobs=n_jobs)
+    start = time.perf_counter()
+    result = getattr(transform, method)()
+    return time.perf_counter() - start, result
+
+
+if __name__ == "__main__":
+
+    n_rows = int(sys.argv[1]) if len(sys.argv) > 1 else 500000
+    df = make_loans(n_rows)
+    job_counts = sorted({1, 2, 4, os.cpu_count() or 1})
+    print(f'{n_rows} rows, {os.cpu_count()} cores available\n')
+
+    for method in ['impute_null_values', 'transform_columns', 'treat_outliers']:
+        serial_time, serial = time_method(df, method, 1)
+        for n_jobs in job_counts:
+            elapsed, result = (serial_time, serial) if n_jobs == 1 else time_method(df, method, n_jobs)
+            diff = (result.select_dtypes('float64') - serial.select_dtypes('float64')).abs().max().max()
+            print(f'{method:20} n_jobs={n_jobs:<3} {elapsed:7.2f} s  speedup {serial_time / elapsed:5.2f}  max |diff| {diff:.1e}')
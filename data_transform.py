@@ -4,6 +4,8 @@ import missingno as msno
 import matplotlib.pyplot as plt
 import seaborn as sns
 from sklearn.preprocessing import PowerTransformer
+import parallel_utils as pu
+import memory_utils as mu
 
 class DataFrameTransform:
     '''
@@ -14,6 +16,25 @@ class DataFrameTransform:
     data_frame: DataFrame
         A Pandas DataFrame from which information will be generated.
 
+    n_jobs: int, optional
+        The number of worker processes. 1 (the default) runs on a single core. -1 uses all available cores.
+        Above 1, the methods run in a process pool over a shared-memory copy of the columns they work on.
+        The fill values, Yeo-Johnson lambdas and quartiles are computed one task per column, so those steps
+        use at most as many cores as there are columns. Only the Yeo-Johnson transform, the standardization
+        and the capping are split into row partitions, with the column moments merged across them.
+
+    copy: bool, optional
+        If True (the default), the caller's DataFrame is left untouched; under copy-on-write the copy is lazy
+        and only the columns which get modified are copied. The columns with NULL values are still copied when
+        they are imputed, so treat_outliers() peaks at about 1.56x the dataset size on a float-heavy frame.
+        If False, the instance takes ownership of data_frame and modifies it in place, and the peak is about
+        0.9x. Only copy=False gets close to the size of the dataset.
+
+    memory_tracker: MemoryTracker, optional
+        A memory_utils.MemoryTracker on which each method records the bytes it allocated. With n_jobs above 1
+        the allocations are under-reported: the shared-memory block is mapped with mmap and the worker
+        processes allocate outside the tracer.
+
     Methods:
     --------
     drop_null_columns()
@@ -28,9 +49,12 @@ class DataFrameTransform:
     treat_outliers()
         Treats the outliers via the capping method.
     '''
-    def __init__(self, data_frame) -> None:
-        self.df = data_frame
+    def __init__(self, data_frame, n_jobs=1, copy=True, memory_tracker=None) -> None:
+        self.df = mu.take_frame(data_frame, copy)
+        self.n_jobs = pu.resolve_n_jobs(n_jobs)
+        self.memory_tracker = memory_tracker
 
+    @mu.tracked_stage
     def drop_null_columns(self):
         '''This method drops columns with more that 50% NULL values, and rows of date columns with NULL values.
               
@@ -45,11 +69,12 @@ class DataFrameTransform:
         date_cols = []
         
         # delete columns with more than 50 % null values.
+        null_counts = self.df.isnull().sum()
         for col in cols:
-            if 100*(self.df[col].isnull().sum()/len(self.df)) > 50:
+            if 100*(null_counts[col]/len(self.df)) > 50:
                 drop_cols.append(col)
        
-        self.df = self.df.drop(columns = drop_cols)
+        self.df.drop(columns = drop_cols, inplace = True)
         
         # delete rows of date columns with NULL values.
         new_cols = self.df.columns
@@ -60,11 +85,12 @@ class DataFrameTransform:
         self.df.dropna(subset = date_cols, inplace = True)
 
         # Resetting the indices using df.reset_index()
-        self.df = self.df.reset_index(drop=True)
+        self.df.reset_index(drop=True, inplace=True)
     
         return self.df           
        
     
+    @mu.tracked_stage
     def impute_null_values(self):         
         '''This method imputes null values in the DataFrame.
               
@@ -73,20 +99,48 @@ class DataFrameTransform:
         dataframe
             A Pandas DataFrame
         '''
+        if self.n_jobs > 1:
+            for feature, value in pu.impute_values(self.drop_null_columns(), self.n_jobs).items():
+                self._fill_nulls(feature, value)
+
+            return self.df
+
         for feature in self.drop_null_columns().columns:
 
+            if not self.df[feature].hasnans:
+                continue
+
             if self.df[feature].dtype == 'category':
-                self.df[feature] = self.df[feature].fillna(self.df[feature].mode()[0])
+                self._fill_nulls(feature, self.df[feature].mode()[0])
 
             elif self.df[feature].dtype == 'float64' or self.df[feature].dtype == 'Int64' or self.df[feature].dtype == 'int64' or self.df[feature].dtype ==  'object':
-                self.df[feature] = self.df[feature].fillna(self.df[feature].median())
+                self._fill_nulls(feature, self.df[feature].median())
  
         return self.df
+
+
+    def _fill_nulls(self, feature, value):
+        '''This method writes the fill value into the NULL cells of a column in place, rather than replacing the column with a filled copy.
+              
+        Parameters:
+        -----------
+        feature: str
+            The column to fill
+        value: object
+            The fill value
+        '''
+        self.df.loc[self.df[feature].isnull(), feature] = value
     
     
     # DO NOT USE THIS METHOD
-    def transform_columns(self):
+    @mu.tracked_stage
+    def transform_columns(self, cap_outliers=False):
         '''This method transforms to identified columns of the DataFrame to reduce skewness.
+
+        Parameters:
+        -----------
+        cap_outliers: bool, optional
+            If True, the transformed columns are also capped as in treat_outliers(). Defaults to False.
               
         Returns:
         --------
@@ -95,19 +149,38 @@ class DataFrameTransform:
         '''  
         #select only the numeric columns in the DataFrame
         df = self.impute_null_values().select_dtypes(include=['float64']) # include=np.number
+
+        if self.n_jobs > 1:
+            with pu.SharedBlockPool(df, self.n_jobs) as pool:
+                pu.power_transform(pool)
+                if cap_outliers:
+                    pu.cap_outliers(pool)
+
+                return pd.DataFrame(pool.array.copy(order='F'), columns=df.columns, copy=False)
         
         # Model Creation
-        p_scaler = PowerTransformer(method='yeo-johnson')
+        p_scaler = PowerTransformer(method='yeo-johnson', copy=False)
         # yeojohnTr = PowerTransformer(standardize=True)   # not using method attribute as yeo-johnson is the default
 
-        # fitting and transforming the model
-        df_yjt = pd.DataFrame(p_scaler.fit_transform(df), columns=df.columns)
+        # fitting and transforming the model in place, one column at a time so that sklearn's temporaries are the
+        # size of a column, on an array which does not share memory with self.df
+        values = df.to_numpy(dtype=np.float64, copy=not mu.copy_on_write_enabled())
+        if not values.flags.writeable:
+            values = values.copy()
+        for j in range(values.shape[1]):
+            values[:, j:j + 1] = p_scaler.fit_transform(values[:, j:j + 1])
+
+        df_yjt = pd.DataFrame(values, columns=df.columns, copy=False)
+
+        if cap_outliers:
+            self._cap_outliers(df_yjt)
 
         return df_yjt   
     
 
 
     # Capping - change the outlier values to upper or lower limit values
+    @mu.tracked_stage
     def treat_outliers(self):
         '''This method treats the outliers via the capping method.
               
@@ -116,11 +189,18 @@ class DataFrameTransform:
         dataframe
             A Pandas DataFrame
         ''' 
-        # select only the numeric columns in the DataFrame
-        df = self.transform_columns().select_dtypes(include=['float64'])
-        new_df = df.copy()
-       
-        for feature in df.columns:
+        return self.transform_columns(cap_outliers=True)
+
+
+    def _cap_outliers(self, new_df):
+        '''This method caps the values of every column beyond 1.5 IQR from its quartiles, in place.
+
+        Parameters:
+        -----------
+        new_df: DataFrame
+            A Pandas DataFrame of numeric columns which is not shared with the caller
+        '''
+        for feature in new_df.columns:
  
             q1 = new_df[feature].quantile(0.25) 
             q3 = new_df[feature].quantile(0.75) 
@@ -131,8 +211,6 @@ class DataFrameTransform:
             new_df.loc[new_df[feature]<=lower_limit, feature] = lower_limit
             new_df.loc[new_df[feature]>=upper_limit, feature] = upper_limit
 
-        return new_df        
-
 
 
 
@@ -140,6 +218,7 @@ if __name__ == "__main__":
     
     import dtype_transform as tf
     import dataframe_info as dx
+    mu.enable_copy_on_write()
     df = pd.read_csv('loan_payments.csv')
     to_object_columns = ['id', 'member_id', 'policy_code']
     to_float_columns = ['loan_amount'] 
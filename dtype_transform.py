@@ -1,4 +1,5 @@
 import pandas as pd
+import memory_utils as mu
 # from datetime import datetime as dt
 
 class DataTransform:
@@ -10,6 +11,14 @@ class DataTransform:
     data_frame: DataFrame
         A Pandas DataFrame for transformation
 
+    copy: bool, optional
+        If False (the default), the instance takes ownership of data_frame and converts its columns in place.
+        If True, the caller's DataFrame is left untouched; under copy-on-write the copy is lazy and only the
+        converted columns are copied.
+
+    memory_tracker: MemoryTracker, optional
+        A memory_utils.MemoryTracker on which each method records the bytes it allocated.
+
     Methods:
     --------
     to_object(column_list)
@@ -28,9 +37,38 @@ class DataTransform:
         Converts the datatype of the listed columns to 'datetime64'
     '''
 
-    def __init__(self, data_frame) -> None:
-        self.df = data_frame
+    def __init__(self, data_frame, copy=False, memory_tracker=None) -> None:
+        self.df = mu.take_frame(data_frame, copy)
+        self.memory_tracker = memory_tracker
+        
+    def _check_columns(self, column_list):
+        '''This method raises a KeyError if any of the listed columns is missing, before any column is converted.
         
+        Parameters:
+        -----------
+        column_list: list
+            A list of DataFrame columns for dataype conversion
+        '''
+        missing = [col for col in column_list if col not in self.df.columns]
+        if missing:
+            raise KeyError(f'{missing} not in index')
+
+    def _convert(self, column_list, dtype):
+        '''This method converts the listed columns one at a time, replacing each column without building an intermediate DataFrame.
+        
+        Parameters:
+        -----------
+        column_list: list
+            A list of DataFrame columns for dataype conversion
+        dtype: str or type
+            The target datatype
+        '''
+        self._check_columns(column_list)
+        for feature in column_list:
+            if self.df[feature].dtype != dtype:
+                self.df[feature] = self.df[feature].astype(dtype)
+
+    @mu.tracked_stage
     def to_object(self, column_list):
         '''This method converts the datatype of the listed columns to 'object'.
         
@@ -45,11 +83,12 @@ class DataTransform:
             A Pandas DataFrame
         '''
         
-        self.df[column_list] = self.df[column_list].astype(object)
+        self._convert(column_list, object)
 
         return self.df
     
 
+    @mu.tracked_stage
     def to_float(self, column_list):
         '''This method converts the datatype of the listed columns to 'float64'.
         
@@ -64,11 +103,12 @@ class DataTransform:
             A Pandas DataFrame
         '''
         
-        self.df[column_list] = self.df[column_list].astype('float64')
+        self._convert(column_list, 'float64')
 
         return self.df
     
 
+    @mu.tracked_stage
     def to_category(self, column_list):
         '''This method converts the datatype of the listed columns to 'category'.
         
@@ -83,11 +123,12 @@ class DataTransform:
             A Pandas DataFrame
         '''
         
-        self.df[column_list] = self.df[column_list].astype('category')
+        self._convert(column_list, 'category')
 
         return self.df
     
     
+    @mu.tracked_stage
     def to_integer(self, column_list):
         '''This method converts the datatype of the listed columns to 'Int64'.
         
@@ -102,11 +143,12 @@ class DataTransform:
             A Pandas DataFrame
         '''
         
-        self.df[column_list] = self.df[column_list].astype('Int64')
+        self._convert(column_list, 'Int64')
 
         return self.df
     
 
+    @mu.tracked_stage
     def to_datetime(self, column_list):
         '''This method converts the datatype of the listed columns to 'datetime64'.
         
@@ -121,6 +163,7 @@ class DataTransform:
             A Pandas DataFrame
         '''
         
+        self._check_columns(column_list)
         for feature in column_list:
             self.df[feature] =  pd.to_datetime(self.df[feature], format='%b-%Y')
 
@@ -130,6 +173,7 @@ class DataTransform:
 
 if __name__ == "__main__":
 
+    mu.enable_copy_on_write()
     df = pd.read_csv('loan_payments.csv')
 
     to_object_columns = ['id', 'member_id', 'policy_code']
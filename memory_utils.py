@@ -0,0 +1,164 @@
+import functools
+import tracemalloc
+import pandas as pd
+from contextlib import contextmanager
+
+
+def copy_on_write_enabled():
+    '''This function checks whether Pandas copy-on-write semantics are active.
+
+    Returns:
+    --------
+    bool
+        True for Pandas 3 and later, or when the 'mode.copy_on_write' option has been switched on
+    '''
+    if int(pd.__version__.split('.')[0]) >= 3:
+        return True
+    return pd.get_option('mode.copy_on_write') is True
+
+
+def enable_copy_on_write():
+    '''This function switches on Pandas copy-on-write semantics, which are always on from Pandas 3.
+
+    With copy-on-write, copies taken by the transform classes are lazy and only the columns which are modified get copied.
+    '''
+    if not copy_on_write_enabled():
+        pd.set_option('mode.copy_on_write', True)
+
+
+def take_frame(data_frame, copy):
+    '''This function returns the DataFrame a transform class will work on.
+
+    Parameters:
+    -----------
+    data_frame: DataFrame
+        The Pandas DataFrame passed by the caller
+    copy: bool
+        If True, the caller's DataFrame is left untouched by working on a copy of it. The copy is lazy under
+        copy-on-write, otherwise it is a deep copy; either way, every column the class modifies ends up copied,
+        so peak memory is well above the size of the dataset. If False, the class takes ownership of the
+        caller's DataFrame and modifies it in place, which is the only way to keep close to 1x.
+
+    Returns:
+    --------
+    dataframe
+        A Pandas DataFrame
+    '''
+    if not copy:
+        return data_frame
+    return data_frame.copy(deep=not copy_on_write_enabled())
+
+
+def frame_nbytes(data_frame):
+    '''This function returns the memory used by a DataFrame, including its index and object values.
+
+    Parameters:
+    -----------
+    data_frame: DataFrame
+        A Pandas DataFrame
+
+    Returns:
+    --------
+    int
+        The size of the DataFrame in bytes
+    '''
+    return int(data_frame.memory_usage(index=True, deep=True).sum())
+
+
+def tracked_stage(method):
+    '''This decorator records a transform method as a stage on the instance's memory_tracker, when it has one.
+
+    The stage is named after the class and method, e.g. 'DataTransform.to_float'.
+
+    Parameters:
+    -----------
+    method: callable
+        A method of a class with a memory_tracker attribute
+
+    Returns:
+    --------
+    callable
+        The wrapped method
+    '''
+    @functools.wraps(method)
+    def wrapper(self, *args, **kwargs):
+        if self.memory_tracker is None:
+            return method(self, *args, **kwargs)
+        with self.memory_tracker.stage(f'{type(self).__name__}.{method.__name__}'):
+            return method(self, *args, **kwargs)
+    return wrapper
+
+
+class MemoryTracker:
+    '''
+    This class records how many bytes each stage of a pipeline allocated, using tracemalloc.
+
+    Only allocations made in the current process and reported to tracemalloc (NumPy arrays and Python objects)
+    are counted. Stages may be nested, in which case the outer stage includes the allocations of the inner ones.
+
+    Parallel stages are under-reported: shared memory (parallel_utils.SharedBlockPool) is mapped with mmap,
+    which tracemalloc does not trace, and allocations made in worker processes are not seen at all. For
+    n_jobs above 1, add the size of the shared block, 8 bytes per cell of the columns sent to the pool.
+
+    Methods:
+    --------
+    stage(name)
+        Context manager which records the allocations made inside it under the given stage name
+
+    report(data_frame=None)
+        Returns the recorded stages as a DataFrame
+    '''
+    def __init__(self) -> None:
+        self.stages = []
+        self._stack = []
+
+    @contextmanager
+    def stage(self, name):
+        '''This method records the bytes allocated inside the context under the given stage name.
+
+        Parameters:
+        -----------
+        name: str
+            The name of the stage
+        '''
+        started = not tracemalloc.is_tracing()
+        if started:
+            tracemalloc.start()
+
+        current, peak = tracemalloc.get_traced_memory()
+        # Keep the enclosing stage's peak before resetting it for this stage.
+        if self._stack:
+            self._stack[-1]['peak'] = max(self._stack[-1]['peak'], peak)
+        tracemalloc.reset_peak()
+        entry = {'start': current, 'peak': current}
+        self._stack.append(entry)
+
+        try:
+            yield
+        finally:
+            current, peak = tracemalloc.get_traced_memory()
+            peak = max(peak, entry['peak'])
+            self._stack.pop()
+            if self._stack:
+                self._stack[-1]['peak'] = max(self._stack[-1]['peak'], peak)
+            self.stages.append([name, peak - entry['start'], current - entry['start']])
+            if started:
+                tracemalloc.stop()
+
+    def report(self, data_frame=None):
+        '''This method returns the bytes allocated by each recorded stage.
+
+        Parameters:
+        -----------
+        data_frame: DataFrame, optional
+            The dataset, used to express the peak allocation of each stage as a multiple of its size
+
+        Returns:
+        --------
+        data
+            A dataset of stage, peak allocated bytes and bytes still held at the end of the stage
+        '''
+        data = pd.DataFrame(self.stages, columns=['stage', 'allocated bytes', 'retained bytes'])
+        if data_frame is not None:
+            data['x dataset size'] = data['allocated bytes'] / frame_nbytes(data_frame)
+        return data
@@ -0,0 +1,434 @@
+import os
+import warnings
+import numpy as np
+import pandas as pd
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import shared_memory
+from scipy import stats
+
+# Worker-side handle on the shared block, set by _attach_block() when a worker process starts.
+_worker_block = {}
+
+
+def resolve_n_jobs(n_jobs):
+    '''This function resolves the requested number of worker processes.
+
+    Parameters:
+    -----------
+    n_jobs: int
+        The requested number of worker processes. As in joblib and scikit-learn, -1 uses all available cores,
+        -2 all but one, and so on. None means 1.
+
+    Returns:
+    --------
+    int
+        The number of worker processes to start
+    '''
+    if n_jobs is None:
+        return 1
+    if n_jobs == 0:
+        raise ValueError('n_jobs == 0 has no meaning, use a positive number or -1 for all cores')
+    if n_jobs < 0:
+        return max(1, (os.cpu_count() or 1) + 1 + n_jobs)
+    return n_jobs
+
+
+def partition_bounds(n_rows, n_parts):
+    '''This function splits a range of rows into contiguous (start, stop) partitions.
+
+    Parameters:
+    -----------
+    n_rows: int
+        The number of rows to partition
+    n_parts: int
+        The number of partitions
+
+    Returns:
+    --------
+    list
+        A list of (start, stop) tuples, one per non-empty partition
+    '''
+    edges = np.linspace(0, n_rows, max(1, min(n_parts, n_rows)) + 1).astype(int)
+    return [(int(start), int(stop)) for start, stop in zip(edges[:-1], edges[1:])]
+
+
+def merge_moments(partials):
+    '''This function merges partial (count, mean, M2) moments using Chan's parallel algorithm.
+
+    Parameters:
+    -----------
+    partials: list
+        A list of (count, mean, M2) tuples of numpy arrays
+
+    Returns:
+    --------
+    tuple
+        The merged (count, mean, M2) arrays
+    '''
+    n, mean, m2 = partials[0]
+    for n_b, mean_b, m2_b in partials[1:]:
+        total = n + n_b
+        with np.errstate(invalid='ignore', divide='ignore'):
+            delta = mean_b - mean
+            mean = np.where(total > 0, mean + delta * n_b / total, 0.0)
+            m2 = np.where(total > 0, m2 + m2_b + delta ** 2 * n * n_b / total, 0.0)
+        n = total
+    return n, mean, m2
+
+
+def merge_value_counts(partials):
+    '''This function merges partial value counts of a column into global counts sorted by value.
+
+    Parameters:
+    -----------
+    partials: list
+        A list of Pandas Series produced by Series.value_counts()
+
+    Returns:
+    --------
+    series
+        A Pandas Series of counts indexed by sorted value
+    '''
+    return pd.concat(partials).groupby(level=0, sort=True, observed=False).sum()
+
+
+def _value_at(values, cum_counts, k):
+    # The k-th (0-based) element of the sorted data described by values and cumulative counts.
+    return values[np.searchsorted(cum_counts, k, side='right')]
+
+
+def median_from_counts(values, counts):
+    '''This function computes the exact median of a column from its merged value counts.
+
+    Parameters:
+    -----------
+    values: array
+        The distinct non-null values, sorted
+    counts: array
+        The number of occurrences of each value
+
+    Returns:
+    --------
+    float
+        The median, or NaN when there are no values
+    '''
+    cum_counts = np.cumsum(counts)
+    n = int(cum_counts[-1]) if len(cum_counts) else 0
+    if n == 0:
+        return np.nan
+    lower = _value_at(values, cum_counts, (n - 1) // 2)
+    upper = _value_at(values, cum_counts, n // 2)
+    return float((lower + upper) / 2)
+
+
+def mode_from_counts(counts):
+    '''This function returns the most frequent value from merged value counts, ties resolved by sort order.
+
+    Parameters:
+    -----------
+    counts: series
+        A Pandas Series of counts indexed by sorted value
+
+    Returns:
+    --------
+    object
+        The most frequent value
+    '''
+    return counts.idxmax()
+
+
+def _moments(x):
+    # Partial (count, mean, M2) of the non-null values of x.
+    x = x[~np.isnan(x)]
+    if len(x) == 0:
+        return 0, 0.0, 0.0
+    mean = x.mean()
+    return len(x), mean, ((x - mean) ** 2).sum()
+
+
+def _is_constant(n, mean, var):
+    # Same test as scikit-learn uses to leave near constant features untransformed.
+    eps = np.finfo(np.float64).eps
+    return var <= n * eps * var + (n * mean * eps) ** 2
+
+
+def _attach_block(name, shape):
+    shm = shared_memory.SharedMemory(name=name)
+    _worker_block['shm'] = shm
+    _worker_block['array'] = np.ndarray(shape, dtype=np.float64, buffer=shm.buf, order='F')
+
+
+def _value_counts(part):
+    return {col: part[col].value_counts() for col in part.columns}
+
+
+def _column_median(j):
+    with warnings.catch_warnings():
+        # An all NULL column has a NaN median, as in Pandas, without the 'All-NaN slice' warning.
+        warnings.simplefilter('ignore', RuntimeWarning)
+        return float(np.nanmedian(_worker_block['array'][:, j]))
+
+
+def _column_fill_value(j, categorical):
+    # The median of a numeric column, or the most frequent code of a category column, the lowest code on ties
+    # as in Series.mode().
+    if not categorical[j]:
+        return _column_median(j)
+    x = _worker_block['array'][:, j]
+    x = x[~np.isnan(x)]
+    if len(x) == 0:
+        return None
+    return int(np.argmax(np.bincount(x.astype(np.intp))))
+
+
+def _column_quartiles(j):
+    with warnings.catch_warnings():
+        warnings.simplefilter('ignore', RuntimeWarning)
+        return np.nanquantile(_worker_block['array'][:, j], [0.25, 0.75])
+
+
+def _fit_lambda(j):
+    # Fits one column over all rows, with the same calls as sklearn's PowerTransformer.
+    x = _worker_block['array'][:, j]
+    with np.errstate(invalid='ignore', over='ignore'):
+        if _is_constant(len(x), np.mean(x), np.var(x)):
+            return None
+        return stats.yeojohnson(x[~np.isnan(x)], lmbda=None)[1]
+
+
+def _block_power_transform(bounds, lambdas):
+    block = _worker_block['array'][bounds[0]:bounds[1]]
+    moments = []
+    with np.errstate(invalid='ignore', over='ignore'):
+        for j, lmbda in enumerate(lambdas):
+            if lmbda is not None:
+                block[:, j] = stats.yeojohnson(block[:, j], lmbda)
+            moments.append(_moments(block[:, j]))
+    return moments
+
+
+def _block_standardize(bounds, means, scales):
+    block = _worker_block['array'][bounds[0]:bounds[1]]
+    block -= means
+    block /= scales
+
+
+def _block_clip(bounds, lower_limits, upper_limits):
+    block = _worker_block['array'][bounds[0]:bounds[1]]
+    np.clip(block, lower_limits, upper_limits, out=block)
+
+
+class SharedBlockPool:
+    '''
+    This class holds a float64 block in shared memory and a process pool whose workers operate on it.
+
+    Parameters:
+    -----------
+    data: DataFrame or array
+        The numeric data which is copied into shared memory as float64, one column at a time, with NULL values as NaN.
+        Category columns are copied as their category codes.
+    n_jobs: int
+        The number of worker processes, and of row partitions for map() and map_frame()
+
+    Methods:
+    --------
+    map(func, *args)
+        Runs a worker function over every row partition and returns the partial results
+
+    map_columns(func, *args)
+        Runs a worker function over every column and returns the results
+
+    map_frame(data_frame, func, *args)
+        Runs a worker function over the row partitions of a DataFrame held outside the shared block
+
+    close()
+        Shuts down the pool and releases the shared memory
+    '''
+    def __init__(self, data, n_jobs) -> None:
+        self.shm = shared_memory.SharedMemory(create=True, size=max(data.shape[0] * data.shape[1] * 8, 1))
+        try:
+            self.array = np.ndarray(data.shape, dtype=np.float64, buffer=self.shm.buf, order='F')
+            # Column by column, so a DataFrame is never materialised as one more 2-D array.
+            for j in range(data.shape[1]):
+                if not isinstance(data, pd.DataFrame):
+                    self.array[:, j] = data[:, j]
+                elif data.iloc[:, j].dtype == 'category':
+                    codes = data.iloc[:, j].cat.codes.to_numpy()
+                    self.array[:, j] = np.where(codes < 0, np.nan, codes)
+                else:
+                    self.array[:, j] = data.iloc[:, j].to_numpy(dtype=np.float64, na_value=np.nan)
+            self.bounds = partition_bounds(data.shape[0], n_jobs)
+            self.pool = ProcessPoolExecutor(max_workers=max(1, len(self.bounds)),
+                                            initializer=_attach_block,
+                                            initargs=(self.shm.name, data.shape))
+        except BaseException:
+            self.array = None
+            self.shm.close()
+            self.shm.unlink()
+            raise
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def map(self, func, *args):
+        '''This method runs a worker function over every row partition of the shared block.
+
+        Parameters:
+        -----------
+        func: callable
+            A module level function taking (start, stop) bounds followed by *args
+
+        Returns:
+        --------
+        list
+            The partial results, one per partition
+        '''
+        return list(self.pool.map(func, self.bounds, *[[arg] * len(self.bounds) for arg in args]))
+
+    def map_columns(self, func, *args):
+        '''This method runs a worker function over every column of the shared block, one task per column.
+
+        Parameters:
+        -----------
+        func: callable
+            A module level function taking a column position followed by *args
+
+        Returns:
+        --------
+        list
+            The results, one per column
+        '''
+        n_cols = self.array.shape[1]
+        return list(self.pool.map(func, range(n_cols), *[[arg] * n_cols for arg in args]))
+
+    def map_frame(self, data_frame, func, *args):
+        '''This method runs a worker function over row partitions of a DataFrame which cannot be held in the shared
+        block, such as object columns. The partitions are pickled to the workers.
+
+        Parameters:
+        -----------
+        data_frame: DataFrame
+            A Pandas DataFrame with as many rows as the shared block
+        func: callable
+            A module level function taking a DataFrame partition followed by *args
+
+        Returns:
+        --------
+        list
+            The partial results, one per partition
+        '''
+        parts = [data_frame.iloc[start:stop] for start, stop in self.bounds]
+        return list(self.pool.map(func, parts, *[[arg] * len(parts) for arg in args]))
+
+    def close(self):
+        '''This method shuts down the pool and releases the shared memory.'''
+        self.pool.shutdown()
+        self.array = None
+        self.shm.close()
+        self.shm.unlink()
+
+
+def impute_values(data_frame, n_jobs):
+    '''This function computes the fill value of each column with NULL values, in a single process pool.
+
+    Numeric columns are filled with their median and category columns with their mode. Both are computed one task
+    per column over shared memory, which holds the category columns as their codes, so this step uses at most as
+    many workers as there are columns to fill. Object columns are filled with their median, merged
+    from the value counts of row partitions, in the same pool. Only the columns which need filling are copied to
+    shared memory or sent to the worker processes.
+
+    Parameters:
+    -----------
+    data_frame: DataFrame
+        A Pandas DataFrame
+    n_jobs: int
+        The number of worker processes
+
+    Returns:
+    --------
+    dict
+        The fill value of each column which has NULL values
+    '''
+    columns = [col for col in data_frame.columns
+               if data_frame[col].hasnans
+               and (data_frame[col].dtype == 'category' or data_frame[col].dtype == 'float64' or data_frame[col].dtype == 'Int64'
+                    or data_frame[col].dtype == 'int64' or data_frame[col].dtype == 'object')]
+    block_columns = [col for col in columns if data_frame[col].dtype != 'object']
+    object_columns = [col for col in columns if data_frame[col].dtype == 'object']
+    if not columns:
+        return {}
+
+    fill_values = {}
+    with SharedBlockPool(data_frame[block_columns], n_jobs) as pool:
+        categorical = [data_frame[col].dtype == 'category' for col in block_columns]
+        for col, is_category, value in zip(block_columns, categorical, pool.map_columns(_column_fill_value, categorical)):
+            if not is_category:
+                fill_values[col] = value
+            elif value is not None:
+                fill_values[col] = data_frame[col].cat.categories[value]
+
+        if object_columns:
+            partials = pool.map_frame(data_frame[object_columns], _value_counts)
+            for col in object_columns:
+                counts = merge_value_counts([part[col] for part in partials])
+                fill_values[col] = median_from_counts(counts.index.to_numpy(), counts.to_numpy())
+
+    return fill_values
+
+
+def power_transform(pool):
+    '''This function applies a standardized Yeo-Johnson transform to the shared block in place.
+
+    The lambdas are fitted one task per column over all of its rows, with the same scipy calls as sklearn's
+    PowerTransformer, so fitting uses at most as many workers as there are columns. Only the transform and the
+    standardization run over row partitions, with the column moments merged across them.
+
+    Parameters:
+    -----------
+    pool: SharedBlockPool
+        The shared block and its process pool
+
+    Returns:
+    --------
+    list
+        The fitted lambda of each column, None for near constant columns which are left untransformed
+    '''
+    lambdas = pool.map_columns(_fit_lambda)
+
+    partials = pool.map(_block_power_transform, lambdas)
+    n, mean, m2 = merge_moments([tuple(np.array(col) for col in zip(*part)) for part in partials])
+    with np.errstate(invalid='ignore', divide='ignore'):
+        var = m2 / n
+    scales = np.sqrt(var)
+    scales[_is_constant(n, mean, var) | (scales < 10 * np.finfo(np.float64).eps)] = 1.0
+    pool.map(_block_standardize, mean, scales)
+
+    return lambdas
+
+
+def cap_outliers(pool):
+    '''This function caps every column of the shared block in place at 1.5 IQR beyond its quartiles.
+
+    The quartiles are computed one task per column, with the same NumPy call as Pandas, so that step uses at most
+    as many workers as there are columns. The capping then runs over row partitions. NULL values are left as they are.
+
+    Parameters:
+    -----------
+    pool: SharedBlockPool
+        The shared block and its process pool
+
+    Returns:
+    --------
+    tuple
+        The lower and upper limit of each column, as numpy arrays
+    '''
+    q1, q3 = np.array(pool.map_columns(_column_quartiles)).reshape(-1, 2).T
+    iqr = q3 - q1
+    lower_limits, upper_limits = q1 - 1.5 * iqr, q3 + 1.5 * iqr
+    # A column without values has NaN limits, and is left as it is rather than set to NaN by np.clip.
+    pool.map(_block_clip, np.nan_to_num(lower_limits, nan=-np.inf), np.nan_to_num(upper_limits, nan=np.inf))
+
+    return lower_limits, upper_limits
@@ -0,0 +1,94 @@
+import numpy as np
+import pandas as pd
+import pytest
+from sklearn.preprocessing import PowerTransformer
+
+from data_transform import DataFrameTransform
+
+
+@pytest.fixture
+def loans():
+    n_rows = 2000
+    rng = np.random.default_rng(0)
+    df = pd.DataFrame({
+        'id': pd.Series(np.arange(n_rows), dtype=object),
+        'loan_amount': rng.lognormal(9, 1, n_rows),
+        'int_rate': rng.normal(13, 4, n_rows),
+        'recoveries': rng.normal(-5, 2, n_rows),
+        'policy_code': np.full(n_rows, 1.0),
+        'mths_since_last_record': np.where(rng.random(n_rows) < 0.7, np.nan, 1.0),
+        'mths_since_last_delinq': pd.array(np.where(rng.random(n_rows) < 0.2, None, rng.integers(0, 100, n_rows)), dtype='Int64'),
+        'grade': pd.Categorical(rng.choice(list('ABCDEFG'), n_rows)),
+        'issue_date': pd.to_datetime(rng.choice(pd.date_range('2010-01-01', periods=60, freq='MS'), n_rows)),
+    })
+    df.loc[rng.random(n_rows) < 0.1, 'loan_amount'] = np.nan
+    df.loc[rng.random(n_rows) < 0.05, 'grade'] = np.nan
+    df.loc[rng.random(n_rows) < 0.01, 'issue_date'] = pd.NaT
+    return df
+
+
+def test_impute_null_values_parallel_matches_serial(loans):
+    serial = DataFrameTransform(loans).impute_null_values()
+    parallel = DataFrameTransform(loans, n_jobs=2).impute_null_values()
+    pd.testing.assert_frame_equal(parallel, serial)
+
+
+@pytest.mark.parametrize('method', ['transform_columns', 'treat_outliers'])
+def test_transform_parallel_matches_serial(loans, method):
+    serial = getattr(DataFrameTransform(loans), method)()
+    parallel = getattr(DataFrameTransform(loans, n_jobs=2), method)()
+    pd.testing.assert_frame_equal(parallel, serial, check_exact=False, rtol=1e-10, atol=1e-12)
+
+
+def test_impute_null_values_parallel_category_ties_and_object_columns():
+    df = pd.DataFrame({
+        'grade': pd.Categorical(['B', 'A', 'A', 'B', None, 'C'], categories=['C', 'B', 'A']),
+        'member_id': pd.Series([3, 1, None, 2, 5, 4], dtype=object),
+        'loan_amount': [1.0, np.nan, 3.0, 4.0, 5.0, 6.0],
+    })
+    serial = DataFrameTransform(df).impute_null_values()
+    parallel = DataFrameTransform(df, n_jobs=2).impute_null_values()
+    pd.testing.assert_frame_equal(parallel, serial)
+    assert parallel.loc[4, 'grade'] == 'B'
+
+
+def test_copy_false_takes_ownership_of_frame(loans):
+    transform = DataFrameTransform(loans, copy=False)
+    assert transform.df is loans
+    assert transform.impute_null_values() is loans
+    assert 'mths_since_last_record' not in loans.columns
+    assert not loans[['loan_amount', 'mths_since_last_delinq', 'grade']].isnull().any().any()
+
+
+def test_copy_true_leaves_caller_frame_untouched(loans):
+    original = loans.copy(deep=True)
+    DataFrameTransform(loans).treat_outliers()
+    pd.testing.assert_frame_equal(loans, original)
+
+
+def test_fill_nulls_fills_only_null_cells_in_place():
+    df = pd.DataFrame({
+        'loan_amount': [1.0, np.nan, 3.0],
+        'mths_since_last_delinq': pd.array([1, None, 3], dtype='Int64'),
+        'grade': pd.Categorical(['A', None, 'B']),
+    })
+    transform = DataFrameTransform(df, copy=False)
+    transform._fill_nulls('loan_amount', 2.0)
+    transform._fill_nulls('mths_since_last_delinq', 2)
+    transform._fill_nulls('grade', 'B')
+
+    expected = pd.DataFrame({
+        'loan_amount': [1.0, 2.0, 3.0],
+        'mths_since_last_delinq': pd.array([1, 2, 3], dtype='Int64'),
+        'grade': pd.Categorical(['A', 'B', 'B']),
+    })
+    assert transform.df is df
+    pd.testing.assert_frame_equal(df, expected)
+
+
+def test_transform_columns_matches_whole_frame_power_transformer(loans):
+    transform = DataFrameTransform(loans)
+    transformed = transform.transform_columns()
+    numeric = transform.df.select_dtypes(include=['float64'])
+    expected = PowerTransformer(method='yeo-johnson').fit_transform(numeric)
+    pd.testing.assert_frame_equal(transformed, pd.DataFrame(expected, columns=numeric.columns))
@@ -0,0 +1,21 @@
+import pandas as pd
+import pytest
+
+from dtype_transform import DataTransform
+
+
+@pytest.mark.parametrize('method', ['to_object', 'to_float', 'to_category', 'to_integer', 'to_datetime'])
+def test_missing_column_leaves_frame_unchanged(method):
+    df = pd.DataFrame({'a': [1, 2], 'b': ['Jan-2020', 'Feb-2021']})
+    transform = DataTransform(df)
+    with pytest.raises(KeyError):
+        getattr(transform, method)(['a', 'b', 'zz'])
+    pd.testing.assert_frame_equal(df, pd.DataFrame({'a': [1, 2], 'b': ['Jan-2020', 'Feb-2021']}))
+
+
+def test_copy_leaves_caller_frame_unchanged():
+    df = pd.DataFrame({'a': [1, 2]})
+    assert DataTransform(df, copy=True).to_float(['a'])['a'].dtype == 'float64'
+    assert df['a'].dtype == 'int64'
+    DataTransform(df).to_float(['a'])
+    assert df['a'].dtype == 'float64'
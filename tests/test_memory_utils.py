@@ -0,0 +1,63 @@
+import numpy as np
+import pandas as pd
+
+import memory_utils as mu
+
+MB = 1_000_000
+
+
+def test_stage_records_peak_and_retained_bytes():
+    tracker = mu.MemoryTracker()
+    with tracker.stage('temporary'):
+        np.ones(MB)
+    with tracker.stage('kept'):
+        kept = np.ones(MB)
+
+    (name, allocated, retained), (kept_name, kept_allocated, kept_retained) = tracker.stages
+    assert (name, kept_name) == ('temporary', 'kept')
+    assert allocated >= 8 * MB and retained < MB
+    assert kept_allocated >= 8 * MB and kept_retained >= 8 * MB
+    assert kept.nbytes == 8 * MB
+
+
+def test_nested_stage_peak_is_included_in_outer_stage():
+    tracker = mu.MemoryTracker()
+    with tracker.stage('outer'):
+        with tracker.stage('inner'):
+            np.ones(2 * MB)
+        np.ones(MB)
+
+    stages = {name: (allocated, retained) for name, allocated, retained in tracker.stages}
+    assert [name for name, _, _ in tracker.stages] == ['inner', 'outer']
+    assert 16 * MB <= stages['inner'][0] <= stages['outer'][0]
+    assert stages['outer'][0] < 24 * MB
+
+
+def test_report_expresses_peaks_as_multiples_of_dataset_size():
+    tracker = mu.MemoryTracker()
+    with tracker.stage('copy'):
+        df = pd.DataFrame({'a': np.ones(MB)})
+
+    report = tracker.report()
+    assert list(report.columns) == ['stage', 'allocated bytes', 'retained bytes']
+
+    report = tracker.report(df)
+    assert list(report.columns) == ['stage', 'allocated bytes', 'retained bytes', 'x dataset size']
+    assert report.loc[0, 'x dataset size'] == report.loc[0, 'allocated bytes'] / mu.frame_nbytes(df)
+    assert report.loc[0, 'x dataset size'] >= 1
+
+
+def test_take_frame_without_copy_takes_ownership():
+    df = pd.DataFrame({'a': [1.0, 2.0]})
+    assert mu.take_frame(df, copy=False) is df
+
+
+def test_take_frame_with_copy_leaves_caller_frame_untouched():
+    df = pd.DataFrame({'a': [1.0, 2.0]})
+    taken = mu.take_frame(df, copy=True)
+    assert taken is not df
+    # Under copy-on-write the copy is lazy, and only made when the taken frame is modified.
+    assert np.shares_memory(taken['a'].to_numpy(), df['a'].to_numpy()) == mu.copy_on_write_enabled()
+
+    taken.loc[0, 'a'] = 5.0
+    assert df.loc[0, 'a'] == 1.0
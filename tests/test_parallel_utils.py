@@ -0,0 +1,60 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+import parallel_utils as pu
+
+
+@pytest.mark.parametrize('n_values', [1, 2, 7, 10, 101])
+def test_median_from_counts_matches_numpy(n_values):
+    rng = np.random.default_rng(n_values)
+    data = rng.integers(0, 5, n_values).astype(float)
+    values, counts = np.unique(data, return_counts=True)
+    assert pu.median_from_counts(values, counts) == np.median(data)
+
+
+def test_median_from_counts_of_merged_value_counts():
+    data = pd.Series([3, 1, 4, 1, 5, 9, 2, 6, 5, 3, 5], dtype=object)
+    counts = pu.merge_value_counts([data[:4].value_counts(), data[4:].value_counts()])
+    assert pu.median_from_counts(counts.index.to_numpy(), counts.to_numpy()) == pd.Series(data.astype(float)).median()
+
+
+def test_median_from_counts_empty():
+    assert np.isnan(pu.median_from_counts(np.array([]), np.array([], dtype=int)))
+
+
+def test_merge_moments_matches_numpy():
+    rng = np.random.default_rng(0)
+    data = rng.lognormal(8, 2, 1000)
+    partials = []
+    for start, stop in [(0, 1), (1, 400), (400, 400), (400, 1000)]:
+        part = data[start:stop]
+        mean = part.mean() if len(part) else 0.0
+        partials.append((len(part), mean, ((part - mean) ** 2).sum()))
+
+    n, mean, m2 = pu.merge_moments(partials)
+    assert n == len(data)
+    assert mean == pytest.approx(np.mean(data), rel=1e-12)
+    assert m2 / n == pytest.approx(np.var(data), rel=1e-12)
+
+
+def test_merge_value_counts_keeps_category_order():
+    data = pd.Series(pd.Categorical(['b', 'a', 'b', 'c', 'a'], categories=['c', 'b', 'a']))
+    counts = pu.merge_value_counts([data[:2].value_counts(), data[2:].value_counts()])
+    assert list(counts.index) == ['c', 'b', 'a']
+    assert pu.mode_from_counts(counts) == data.mode()[0]
+
+
+def test_partition_bounds_cover_all_rows():
+    bounds = pu.partition_bounds(10, 3)
+    assert bounds[0][0] == 0 and bounds[-1][1] == 10
+    assert all(stop == start for (_, stop), (start, _) in zip(bounds, bounds[1:]))
+    assert pu.partition_bounds(2, 4) == [(0, 1), (1, 2)]
+
+
+def test_resolve_n_jobs():
+    assert pu.resolve_n_jobs(None) == 1
+    assert pu.resolve_n_jobs(3) == 3
+    assert pu.resolve_n_jobs(-1) >= 1
+    with pytest.raises(ValueError):
+        pu.resolve_n_jobs(0)